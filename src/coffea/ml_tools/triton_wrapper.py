@@ -1,5 +1,10 @@
 # For python niceties
+import itertools
+import os
+import queue
 import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import numpy
@@ -13,9 +18,35 @@ try:
 except (ImportError, ModuleNotFoundError) as err:
     _triton_import_error = err
 
+# System shared memory is packaged with tritonclient but is not available on
+# all platforms, so it is handled as a separate optional import.
+_triton_shm_import_error = None
+try:
+    import tritonclient.utils.shared_memory
+except (ImportError, ModuleNotFoundError) as err:
+    _triton_shm_import_error = err
+
 from .helper import nonserializable_attribute, numpy_call_wrapper
 
 
+class _client_pool:
+    """
+    A small round-robin pool of InferenceServerClient instances.
+
+    A single gRPC client holds one HTTP/2 connection, and at high request
+    concurrency head-of-line blocking on that connection caps throughput.
+    Spreading inference requests over a few independent channels removes that
+    cap; metadata queries stay on the wrapper's primary client.
+    """
+
+    def __init__(self, clients: list):
+        self.clients = clients
+        self._selector = itertools.cycle(clients)
+
+    def next_client(self):
+        return next(self._selector)
+
+
 class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
     """
     Wrapper for running triton inference.
@@ -52,13 +83,38 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
         batch_size: int, default -1
             How the input arrays should be split up for analysis processing. Leave negative to
             have this automatically resolved.
+
+        use_shared_memory: bool, default False
+            Transport the input tensors to the server through system shared
+            memory instead of over the network. This bypasses the HTTP/gRPC
+            payload serialization entirely, but is only valid when the client
+            and the triton server run on the same host.
+
+        quantize_fn: dict[str, Callable], optional
+            Per-input functions for converting user arrays to the model's
+            low-precision input format in bulk (ex: an FP32->INT8 mapping like
+            `numpy.clip((x / scale).round(), -128, 127).astype(numpy.int8)`).
+            Inputs without an entry are cast automatically, with a warning
+            raised when the automatic conversion loses precision.
     """
 
     batch_size_fallback = 10  # Fall back should batch size not be determined.
-    http_client_concurrency = 12  # TODO: check whether this value is optimum
+    # Inference throughput keeps scaling well past a dozen concurrent
+    # requests, so the HTTP connection pool follows the core count. The
+    # in-flight request budget is a separate knob: every in-flight slot owns a
+    # full set of staging buffers, so it must not scale with the host size.
+    http_client_concurrency = 2 * (os.cpu_count() or 6)
+    max_inflight_requests = 12  # TODO: check whether this value is optimum
+    grpc_client_pool_size = 4  # TODO: check whether this value is optimum
+    http_payload_warn_size = 32 * (1 << 20)  # Per-request bytes before suggesting gRPC
 
     def __init__(
-        self, model_url: str, client_args: Optional[dict] = None, batch_size=-1
+        self,
+        model_url: str,
+        client_args: Optional[dict] = None,
+        batch_size=-1,
+        use_shared_memory: bool = False,
+        quantize_fn: Optional[dict] = None,
     ):
         if _triton_import_error is not None:
             warnings.warn(
@@ -69,9 +125,24 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
                 UserWarning,
             )
             raise _triton_import_error
+        if use_shared_memory and _triton_shm_import_error is not None:
+            warnings.warn(
+                "System shared memory is not available on this platform!",
+                UserWarning,
+            )
+            raise _triton_shm_import_error
 
         nonserializable_attribute.__init__(
-            self, ["client", "model_metadata", "model_inputs", "model_outputs"]
+            self,
+            [
+                "client",
+                "client_pool",
+                "marshall_pool",
+                "model_metadata",
+                "model_config",
+                "model_inputs",
+                "model_outputs",
+            ],
         )
 
         fullprotocol, location = model_url.split("://")
@@ -82,6 +153,47 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
         # lazy objects have been initialized or additional parsing.
         self._batch_size = batch_size
         self._client_args = client_args
+        self.quantize_fn = quantize_fn if quantize_fn is not None else {}
+
+        # Shared memory regions registered with the server. These wrap raw
+        # process-local handles, so like the client they are never serialized.
+        self.use_shared_memory = use_shared_memory
+        self._shm_regions = {}
+
+        # Caches of the triton request containers, which can be reused across
+        # numpy_call invocations by only re-setting their data. These wrap
+        # protocol objects, so like the client they are never serialized. The
+        # staging buffers are cached alongside them: they back the shared
+        # memory regions and would only bloat the pickled payload.
+        self._infer_input_cache = {}
+        self._infer_output_cache = {}
+        self._staging_cache = {}
+
+        # The numpy_call closure specialized for the last-seen call signature;
+        # it captures the cached containers above, so it is process-local too.
+        self._specialized_call = None
+        self._specialized_key = None
+
+    def __getstate__(self):
+        """
+        In addition to the lazy objects handled by nonserializable_attribute,
+        the shared memory region handles are process-local and are dropped when
+        the wrapper is shipped to another process. The same holds for the
+        cached request containers, which wrap protocol objects.
+        """
+        state = super().__getstate__()
+        state["_shm_regions"] = {}
+        state["_infer_input_cache"] = {}
+        state["_infer_output_cache"] = {}
+        state["_staging_cache"] = {}
+        state["_specialized_call"] = None
+        state["_specialized_key"] = None
+        return state
+
+    def __del__(self):
+        self._release_shared_memory()
+        if getattr(self, "_marshall_pool", None) is not None:
+            self._marshall_pool.shutdown(wait=False)
 
     """
     Spawning the unserializable triton client, as well as other helper objects
@@ -100,16 +212,65 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
                 f"{self.protocol} does not encode a valid protocol (grpc or http)"
             )
 
+    @property
+    def _binary_data_args(self) -> dict:
+        """
+        Extra keyword arguments for the request containers. Binary tensor
+        transport is the tritonclient default for HTTP, but it is enforced
+        here since a JSON-encoded tensor payload would dominate the request
+        cost. The gRPC containers are always binary and take no such flag.
+        """
+        return {"binary_data": True} if self.protocol == "http" else {}
+
     def _create_client(self):
         return self.pmod.InferenceServerClient(url=self.address, **self.client_args)
 
+    def _create_client_pool(self):
+        """
+        The gRPC protocol gets a pool of clients (one HTTP/2 connection each)
+        for inference requests to round-robin over; the HTTP client already
+        spreads requests over its internal connection pool, so a pool of one
+        suffices there. The primary client is always the first pool member.
+        """
+        clients = [self.client]
+        if self.protocol == "grpc":
+            clients += [
+                self.pmod.InferenceServerClient(url=self.address, **self.client_args)
+                for _ in range(self.grpc_client_pool_size - 1)
+            ]
+        return _client_pool(clients)
+
+    def _create_marshall_pool(self):
+        """
+        A small thread pool for staging batches off the main thread. The numpy
+        slice-copy into the staging buffers releases the GIL, so two workers
+        are enough to keep marshalling of upcoming batches overlapped with
+        waiting on earlier responses. The requests themselves are always fired
+        from the main thread.
+        """
+        return ThreadPoolExecutor(max_workers=2)
+
     @property
     def client_args(self) -> dict:
         """
         Function for adding default arguments to the client constructor kwargs.
+        Note that when both protocols are served, gRPC should be preferred over
+        HTTP for large payloads, as its binary encoding avoids most of the
+        per-request serialization cost.
         """
         if self.protocol == "grpc":
-            kwargs = dict(verbose=False, ssl=True)
+            kwargs = dict(
+                verbose=False,
+                ssl=True,
+                # Uncapped message sizes so large tensor payloads are never
+                # rejected at the channel level, plus keepalive pings so
+                # long-lived channels survive between bursts of requests.
+                channel_args=[
+                    ("grpc.max_send_message_length", -1),
+                    ("grpc.max_receive_message_length", -1),
+                    ("grpc.keepalive_time_ms", 30000),
+                ],
+            )
         elif self.protocol == "http":
             kwargs = dict(verbose=False, concurrency=self.http_client_concurrency)
         if self._client_args is not None:
@@ -119,16 +280,31 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
     def _create_model_metadata(self) -> dict:
         return self.client.get_model_metadata(self.model, self.version, as_json=True)
 
+    def _create_model_config(self) -> dict:
+        return self.client.get_model_config(self.model, self.version, as_json=True)[
+            "config"
+        ]
+
     def _create_model_inputs(self) -> dict[str, dict]:
         """
         Extracting the model input data formats from the model_metatdata. Here
         we slightly change the input formats the objects in a format that is
-        easier to manipulate and compare with numpy arrays.
+        easier to manipulate and compare with numpy arrays. The numpy data type
+        is also resolved here, as it is static metadata that would otherwise be
+        repeatedly re-derived in the per-batch inference loops. The ragged
+        batching flag is only exposed through the model configuration, so it is
+        merged in from there.
         """
+        ragged = {
+            x["name"]: bool(x.get("allow_ragged_batch", False))
+            for x in self.model_config.get("input", [])
+        }
         return {
             x["name"]: {
                 "shape": tuple(int(i) for i in x["shape"]),
                 "datatype": x["datatype"],
+                "np_dtype": tritonclient.utils.triton_to_np_dtype(x["datatype"]),
+                "allow_ragged_batch": ragged.get(x["name"], False),
             }
             for x in self.model_metadata["inputs"]
         }
@@ -147,18 +323,26 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
         """
         Getting the batch size to be used for array splitting. If it is
         explicitly set by the users, use that; otherwise, extract from the model
-        configuration hosted on the server.
+        configuration hosted on the server. When the model declares preferred
+        batch sizes for its dynamic batcher, the largest one (clamped to the
+        model's max_batch_size) is used: client batches sitting between
+        preferred sizes get rounded up server-side, so aligning with the
+        largest preferred size maximizes throughput without overshooting.
+        Users with input lengths that leave awkward tail batches should tune
+        batch_size explicitly.
         """
         if self._batch_size < 0:
-            model_config = self.client.get_model_config(
-                self.model, self.version, as_json=True
-            )["config"]
-            if "dynamic_batching" in model_config:
-                self._batch_size = model_config["dynamic_batching"][
-                    "preferred_batch_size"
-                ][0]
+            model_config = self.model_config
+            preferred = model_config.get("dynamic_batching", {}).get(
+                "preferred_batch_size", None
+            )
+            if preferred:
+                self._batch_size = max(int(x) for x in preferred)
+                max_batch_size = int(model_config.get("max_batch_size", 0))
+                if max_batch_size > 0:
+                    self._batch_size = min(self._batch_size, max_batch_size)
             elif "max_batch_size" in model_config:
-                self._batch_size = model_config["max_batch_size"]
+                self._batch_size = int(model_config["max_batch_size"])
             else:
                 warnings.warn(
                     f"Batch size not set by model! Setting to default value {self.batch_size_fallback}. Contact model maintainer to check if this is expected",
@@ -168,6 +352,49 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
 
         return self._batch_size
 
+    """
+    Shared memory handling for same-host deployments
+    """
+
+    def _get_shm_region(self, slot: int, name: str, byte_size: int) -> tuple:
+        """
+        Getting the shared memory region backing the staging buffer of the
+        given slot/input pair, creating and registering it with the server on
+        first use, or re-creating it when the requested size has grown.
+        """
+        region = self._shm_regions.get((slot, name), None)
+        if region is not None and region[2] < byte_size:
+            self.client.unregister_system_shared_memory(region[0])
+            tritonclient.utils.shared_memory.destroy_shared_memory_region(region[1])
+            region = None
+        if region is None:
+            # The region name doubles as the shared memory key, so it must be
+            # unique per wrapper instance to avoid collisions between workers.
+            region_name = f"coffea_{self.model}_{os.getpid()}_{id(self)}_{slot}_{name}"
+            handle = tritonclient.utils.shared_memory.create_shared_memory_region(
+                region_name, "/" + region_name, byte_size
+            )
+            self.client.register_system_shared_memory(
+                region_name, "/" + region_name, byte_size
+            )
+            region = (region_name, handle, byte_size)
+            self._shm_regions[(slot, name)] = region
+        return region
+
+    def _release_shared_memory(self) -> None:
+        """
+        Unregistering all shared memory regions from the server and releasing
+        the local handles. Safe to call when nothing has been registered.
+        """
+        for region_name, handle, _ in getattr(self, "_shm_regions", {}).values():
+            try:
+                if self._client is not None:
+                    self._client.unregister_system_shared_memory(region_name)
+                tritonclient.utils.shared_memory.destroy_shared_memory_region(handle)
+            except Exception:
+                pass  # The server/module may already be gone during teardown
+        self._shm_regions = {}
+
     """
     Numpy/awkward/dask_awkward inference
     """
@@ -207,15 +434,21 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
                     f"Input [{iname}] not defined in model! "
                     f"Inputs defined by model: {[x for x in self.model_inputs.keys()]}"
                 )
-            # Checking the shape
-            ishape = numpy.array(iarr.shape)
-            mshape = numpy.array(self.model_inputs[iname]["shape"])
+            # Checking the shape. Plain tuple comparisons on the cached model
+            # shape; this runs on every inference request, so avoid spinning up
+            # small numpy arrays just for the comparison. Ragged-batch inputs
+            # carry flattened variable-length data, so their shape cannot be
+            # compared against the per-element model shape.
+            if self.model_inputs[iname]["allow_ragged_batch"]:
+                continue
+            ishape = iarr.shape
+            mshape = self.model_inputs[iname]["shape"]
             if len(ishape) != len(mshape):
                 raise ValueError(
                     f"Input [{iname}] got wrong dimension: {len(ishape)} "
                     f"(Expected {len(mshape)})"
                 )
-            if not all(numpy.where(mshape > 0, ishape == mshape, True)):
+            if any(m > 0 and i != m for i, m in zip(ishape, mshape)):
                 raise ValueError(
                     f"Input [{iname}] got array of shape {ishape} "
                     f"(Expected: {mshape}, -1 means arbitrary)"
@@ -224,9 +457,7 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
             # type defined by triton can be found here:
             # https://github.com/triton-inference-server/server/blob/main/docs/user_guide/model_configuration.md#datatypes
             itype = iarr.dtype
-            mtype = tritonclient.utils.triton_to_np_dtype(
-                self.model_inputs[iname]["datatype"]
-            )
+            mtype = self.model_inputs[iname]["np_dtype"]
             if itype != mtype:
                 warnings.warn(
                     f"Input [{iname}] got array of type [{itype}] (Expected [{mtype.__name__}])."
@@ -246,6 +477,119 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
                     f"Requested output [{oname}] not defined by model (Defined: {[x for x in self.model_outputs]})"
                 )
 
+    def _async_infer(self, infer_inputs: list, infer_outputs: list):
+        """
+        Submitting an asynchronous inference request, returning a
+        zero-argument callable that blocks until the response is available
+        (the gRPC client is callback-based, while the HTTP client hands back
+        a future-like object).
+        """
+        client = self.client_pool.next_client()
+        if self.protocol == "grpc":
+            result_queue = queue.Queue()
+            client.async_infer(
+                self.model,
+                model_version=self.version,
+                inputs=infer_inputs,
+                outputs=infer_outputs,
+                callback=lambda result, error: result_queue.put((result, error)),
+            )
+
+            def _get_result():
+                result, error = result_queue.get()
+                if error is not None:
+                    raise error
+                return result
+
+            return _get_result
+        else:
+            return client.async_infer(
+                self.model,
+                model_version=self.version,
+                inputs=infer_inputs,
+                outputs=infer_outputs,
+            ).get_result
+
+    def _ragged_call(
+        self, output_list: list[str], input_dict: dict[str, numpy.array]
+    ) -> dict[str, numpy.array]:
+        """
+        Inference path for models that declare ragged-batch inputs.
+
+        With ragged batching, event boundaries are conveyed to the server
+        through the per-request tensor shapes: each request carries exactly
+        one event, and the server-side dynamic batcher concatenates the
+        requests in flight and fills the model's batch_input shape tensors
+        from the individual request shapes. The leading dimension of every
+        input is therefore treated as the event index, and one request per
+        event is kept in flight up to the usual pipeline depth. Flattening
+        jagged awkward data into per-event rows is expected to be handled in
+        the user's `prepare_awkward`.
+        """
+        infer_outputs = [
+            self.pmod.InferRequestedOutput(output, **self._binary_data_args)
+            for output in output_list
+        ]
+
+        nevents = next(iter(input_dict.values())).shape[0]
+        sources = {
+            name: numpy.ascontiguousarray(
+                numpy.asarray(input_dict[name], dtype=prop["np_dtype"])
+            )
+            for name, prop in self.model_inputs.items()
+        }
+
+        output = None
+
+        def _submit(event):
+            infer_inputs = []
+            for name, prop in self.model_inputs.items():
+                # Slicing rather than indexing keeps the leading batch
+                # dimension: each request carries a single-event batch, as the
+                # server still matches the request rank against the model dims.
+                arr = sources[name][event : event + 1]
+                infer_input = self.pmod.InferInput(
+                    name, list(arr.shape), prop["datatype"]
+                )
+                infer_input.set_data_from_numpy(arr, **self._binary_data_args)
+                infer_inputs.append(infer_input)
+            return self._async_infer(infer_inputs, infer_outputs)
+
+        def _harvest(event, get_result):
+            nonlocal output
+            request = get_result()
+            if output is None:
+                # Each response carries a single-event batch, so its leading
+                # dimension is stripped when stitching the events back
+                # together.
+                output = {
+                    o: numpy.empty(
+                        (nevents, *request.as_numpy(o).shape[1:]),
+                        dtype=request.as_numpy(o).dtype,
+                    )
+                    for o in output_list
+                }
+            for o in output_list:
+                output[o][event] = request.as_numpy(o)[0]
+
+        inflight = deque()
+        for event in range(nevents):
+            if len(inflight) >= self.max_inflight_requests:
+                _harvest(*inflight.popleft())
+            inflight.append((event, _submit(event)))
+        while inflight:
+            _harvest(*inflight.popleft())
+
+        if (
+            output is None
+        ):  # Input was a length-0, so we should generate the length-0 outputs with correct dimension
+            return {
+                o: numpy.zeros(shape=(0, *self.model_outputs[o]["shape"][1:]))
+                for o in output_list
+            }
+
+        return output
+
     def numpy_call(
         self, output_list: list[str], input_dict: dict[str, numpy.array]
     ) -> dict[str, numpy.array]:
@@ -271,68 +615,362 @@ class triton_wrapper(nonserializable_attribute, numpy_call_wrapper):
                 output_list arguments as keys.
         """
 
-        # Setting up the inference input containers
-        def _get_infer_shape(name):
-            ishape = numpy.array(input_dict[name].shape)
-            mshape = numpy.array(self.model_inputs[name]["shape"])
-            mshape = numpy.where(mshape < 0, ishape, mshape)
-            mshape[0] = self.batch_size
-            return mshape
-
-        infer_inputs = [
-            self.pmod.InferInput(name, _get_infer_shape(name), prop["datatype"])
-            for name, prop in self.model_inputs.items()
-        ]
+        # Both the batch splitting and the ragged per-event requests silently
+        # assume that all inputs cover the same events; a mismatched leading
+        # dimension would not fail but produce garbage batches, so it is
+        # checked explicitly up front.
+        orig_len = next(iter(input_dict.values())).shape[0]
+        if any(v.shape[0] != orig_len for v in input_dict.values()):
+            raise ValueError(
+                "All inputs must share the same leading dimension! Got: "
+                f"{ {name: v.shape[0] for name, v in input_dict.items()} }"
+            )
 
-        # Setting up the inference output containers
-        infer_outputs = [
-            self.pmod.InferRequestedOutput(output) for output in output_list
-        ]
+        # Models with ragged-batch inputs bypass the rectangular batching path
+        if any(prop["allow_ragged_batch"] for prop in self.model_inputs.values()):
+            return self._ragged_call(output_list, input_dict)
+
+        # The heavy lifting lives in a closure specialized for the call
+        # signature; coffea workflows invoke numpy_call once per partition
+        # with identical outputs and input layouts, so the signature-invariant
+        # setup only runs when the signature actually changes.
+        key = (
+            tuple(output_list),
+            tuple(
+                (name, input_dict[name].shape[1:], input_dict[name].dtype)
+                for name in self.model_inputs.keys()
+            ),
+        )
+        if self._specialized_key != key:
+            self._specialized_call = self._build_specialized_call(
+                output_list, input_dict
+            )
+            self._specialized_key = key
+        return self._specialized_call(input_dict)
 
-        # Setting up container for storing output.
-        output = None
+    def _quantize_input(self, name: str, arr: numpy.array) -> numpy.array:
+        """
+        Applying the user-supplied bulk quantization function for the given
+        input when one is registered; other inputs are passed through and are
+        cast to the model dtype during staging.
+        """
+        fn = self.quantize_fn.get(name, None)
+        return arr if fn is None else fn(arr)
 
-        # Padding the outermost dimension to a multiple of of the batch size
-        orig_len = list(input_dict.values())[0].shape[0]  # saving original length
-        for start_idx in range(0, orig_len, self.batch_size):
-            stop_idx = min([start_idx + self.batch_size, orig_len])
+    def _build_specialized_call(
+        self, output_list: list[str], input_dict: dict[str, numpy.array]
+    ):
+        """
+        Building the specialized closure behind `numpy_call` for a given call
+        signature (requested outputs plus the trailing shape and data type of
+        every input). All signature-invariant setup -- the inference shapes,
+        the cached request containers, the staging buffers and the padding
+        decision -- is resolved here exactly once, so the returned closure only
+        performs the per-batch staging and submission work.
+        """
 
-            for idx, name in enumerate(self.model_inputs.keys()):
-                mtype = tritonclient.utils.triton_to_np_dtype(
-                    self.model_inputs[name]["datatype"]
+        def _get_infer_shape(name):
+            # Filling variable (negative) model dimensions from the concrete
+            # input, with the leading dimension fixed to the batch size.
+            mshape = [
+                i if m < 0 else m
+                for m, i in zip(
+                    self.model_inputs[name]["shape"], input_dict[name].shape
                 )
-                shape = list(input_dict[name].shape)
-                shape[0] = self.batch_size  # Always pad to fixed length
-                infer_inputs[idx].set_data_from_numpy(
-                    numpy.resize(
-                        input_dict[name][start_idx:stop_idx],  # We need a copy here
-                        tuple(shape),
-                    ).astype(mtype)
+            ]
+            mshape[0] = self.batch_size
+            return mshape
+
+        input_names = list(self.model_inputs.keys())
+        full_shapes = {name: _get_infer_shape(name) for name in input_names}
+
+        # Low-precision transport: the staging buffers carry the model dtype,
+        # so FP16/INT8 models already get their wire payload at model
+        # precision with the conversion folded into the per-batch copy. Warn
+        # once per signature when that automatic conversion loses precision
+        # and no user-supplied quantization function covers the input.
+        for name, prop in self.model_inputs.items():
+            itype = input_dict[name].dtype
+            mtype = numpy.dtype(prop["np_dtype"])
+            if (
+                name not in self.quantize_fn
+                and numpy.promote_types(itype, mtype) != mtype
+            ):
+                warnings.warn(
+                    f"Input [{name}] will be downcast from [{itype}] to [{mtype}]"
+                    " for transport, losing precision. Pass a quantize_fn entry"
+                    " to control the conversion.",
+                    UserWarning,
                 )
 
-            # Making request to server
-            request = self.client.infer(
-                self.model,
-                model_version=self.version,
-                inputs=infer_inputs,
-                outputs=infer_outputs,
-            )
-            if output is None:
-                output = {
-                    o: request.as_numpy(o)[start_idx:stop_idx] for o in output_list
-                }
+        # Setting up the inference output containers, reusing the cached set
+        # for this output selection when one exists.
+        okey = tuple(output_list)
+        infer_outputs = self._infer_output_cache.get(okey, None)
+        if infer_outputs is None:
+            infer_outputs = [
+                self.pmod.InferRequestedOutput(output, **self._binary_data_args)
+                for output in output_list
+            ]
+            self._infer_output_cache[okey] = infer_outputs
+
+        # Up to n_slots requests are kept in flight so that staging, network
+        # transit and server-side inference of different batches overlap. Each
+        # slot owns its own input containers and staging buffers, so that a
+        # request being transmitted never aliases the buffer being filled for a
+        # later batch. Each batch iteration only requires a single slice-copy
+        # into the staging buffer instead of the allocate-and-copy of
+        # numpy.resize followed by astype.
+        n_slots = self.max_inflight_requests
+        ikey = (
+            tuple((name, tuple(full_shapes[name])) for name in input_names),
+            n_slots,
+        )
+        infer_inputs = self._infer_input_cache.get(ikey, None)
+        if infer_inputs is None:
+            infer_inputs = [
+                [
+                    self.pmod.InferInput(name, full_shapes[name], prop["datatype"])
+                    for name, prop in self.model_inputs.items()
+                ]
+                for _ in range(n_slots)
+            ]
+            self._infer_input_cache[ikey] = infer_inputs
+        else:
+            # The cached containers outlive the specialized closures (ex: a
+            # job alternating between two output selections rebuilds the
+            # closure but shares the slots), so a shape shrunk by a previous
+            # closure's final partial batch must be restored unconditionally;
+            # the dirty flag below only tracks shrinks within this closure.
+            for slot_inputs in infer_inputs:
+                for idx, name in enumerate(input_names):
+                    slot_inputs[idx].set_shape(full_shapes[name])
+
+        # The staging buffers only depend on the trailing input shapes, the
+        # batch size and the slot count, so they are pinned to the wrapper and
+        # survive closure rebuilds (ex: a job alternating between two output
+        # selections), keeping their allocation a one-time cost per process.
+        skey = (
+            tuple((name, input_dict[name].shape[1:]) for name in input_names),
+            self.batch_size,
+            n_slots,
+        )
+        staging = self._staging_cache.get(skey, None)
+        if staging is None:
+            if self.use_shared_memory:
+                # Backing each staging buffer directly with its registered
+                # shared memory region, so the per-batch copy lands the tensor
+                # in shared memory with no further copies. Despite its name,
+                # get_contents_as_numpy returns a writable zero-copy ndarray
+                # view over the region's buffer, not a copy of its contents.
+                staging = []
+                for slot in range(n_slots):
+                    bufs = {}
+                    for name, prop in self.model_inputs.items():
+                        shape = (self.batch_size, *input_dict[name].shape[1:])
+                        dtype = numpy.dtype(prop["np_dtype"])
+                        nbytes = int(numpy.prod(shape)) * dtype.itemsize
+                        _, handle, _ = self._get_shm_region(slot, name, nbytes)
+                        bufs[name] = (
+                            tritonclient.utils.shared_memory.get_contents_as_numpy(
+                                handle, dtype, shape
+                            )
+                        )
+                    staging.append(bufs)
             else:
+                staging = [
+                    {
+                        name: numpy.empty(
+                            (self.batch_size, *input_dict[name].shape[1:]),
+                            dtype=prop["np_dtype"],
+                        )
+                        for name, prop in self.model_inputs.items()
+                    }
+                    for _ in range(n_slots)
+                ]
+            self._staging_cache[skey] = staging
+
+        if self.protocol == "http" and not self.use_shared_memory:
+            payload = sum(buf.nbytes for buf in staging[0].values())
+            if payload > self.http_payload_warn_size:
+                warnings.warn(
+                    f"Each inference request will carry {payload} bytes over HTTP."
+                    " Consider the grpc protocol or shared memory transport for"
+                    " payloads of this size.",
+                    UserWarning,
+                )
+
+        # A partial final batch can be sent at its true size when the model
+        # accepts a variable leading dimension; padding (and so wasting
+        # inference compute on garbage rows) is only needed when some input
+        # declares a fixed leading dimension. The dirty flag records that a
+        # shrunk final batch left its slot with a reduced leading dimension,
+        # which is restored on the next invocation.
+        pad_tail = any(prop["shape"][0] > 0 for prop in self.model_inputs.values())
+        shapes_dirty = [False]
+
+        def _submit(slot):
+            """
+            Submitting an asynchronous inference request for the batch staged
+            in the given slot.
+            """
+            return self._async_infer(infer_inputs[slot], infer_outputs)
+
+        def _specialized_call(
+            input_dict: dict[str, numpy.array],
+        ) -> dict[str, numpy.array]:
+            orig_len = next(iter(input_dict.values())).shape[0]
+            num_batches = -(-orig_len // self.batch_size)
+            padded_len = num_batches * self.batch_size
+
+            # Setting up container for storing output.
+            output = None
+
+            if shapes_dirty[0]:
+                for slot_inputs in infer_inputs:
+                    for idx, name in enumerate(input_names):
+                        slot_inputs[idx].set_shape(full_shapes[name])
+                shapes_dirty[0] = False
+
+            # The staging buffers carry the model dtype, and the per-batch
+            # numpy.copyto below performs the cast and the copy in a single
+            # C-level pass into them, so inputs with a mismatched dtype are
+            # converted batch-by-batch without ever materializing a full casted
+            # copy. Inputs that already match are a plain memcpy per batch.
+            # Precomputing the per-batch views of the inputs is free: slicing
+            # only creates zero-copy views, and it removes the per-iteration
+            # index arithmetic from the hot loop.
+            batch_views = {
+                name: [
+                    arr[bi * self.batch_size : (bi + 1) * self.batch_size]
+                    for bi in range(num_batches)
+                ]
+                for name, arr in (
+                    (name, numpy.asarray(self._quantize_input(name, input_dict[name])))
+                    for name in input_names
+                )
+            }
+
+            def _harvest(batch_start, get_result):
+                """
+                Collecting the response of a previously submitted request into
+                the preallocated output arrays. The arrays are allocated once
+                the first response reveals the output shapes and types; each
+                batch then writes into its own slice instead of
+                re-concatenating all previously gathered output.
+                """
+                nonlocal output
+                request = get_result()
+                if output is None:
+                    output = {
+                        o: numpy.empty(
+                            (padded_len, *request.as_numpy(o).shape[1:]),
+                            dtype=request.as_numpy(o).dtype,
+                        )
+                        for o in output_list
+                    }
                 for o in output_list:
-                    output[o] = numpy.concatenate(
-                        (output[o], request.as_numpy(o)), axis=0
+                    res = request.as_numpy(o)
+                    output[o][batch_start : batch_start + res.shape[0]] = res
+
+            def _stage(bi, slot):
+                """
+                Copying a batch into the slot's staging buffers. This runs on
+                the marshalling pool: the numpy copy releases the GIL, so
+                staging of upcoming batches overlaps with the main thread
+                waiting on earlier responses. The request itself is always
+                fired from the main thread, as the gevent-based HTTP client
+                cannot have its greenlets spawned on a worker thread and then
+                awaited elsewhere. A slot is only handed back to this function
+                after its previous request has been harvested, so the buffers
+                are never written while in flight.
+                """
+                start_idx = bi * self.batch_size
+                nbatch = (
+                    self.batch_size if bi < num_batches - 1 else orig_len - start_idx
+                )
+
+                for idx, name in enumerate(input_names):
+                    buf = staging[slot][name]
+                    numpy.copyto(buf[:nbatch], batch_views[name][bi], casting="unsafe")
+                    if nbatch < self.batch_size:
+                        if pad_tail:  # Zero-padding the tail batch
+                            buf[nbatch:] = 0
+                        else:  # Shrinking the request to the true remainder
+                            infer_inputs[slot][idx].set_shape([nbatch, *buf.shape[1:]])
+                            shapes_dirty[0] = True
+                            buf = buf[:nbatch]
+                    if self.use_shared_memory:
+                        # The staging buffer is a view of the registered
+                        # region, so the copy above already placed the tensor
+                        # in shared memory; the input only needs to point at
+                        # the region and the tensor never touches the network
+                        # payload.
+                        region_name, _, _ = self._get_shm_region(slot, name, buf.nbytes)
+                        infer_inputs[slot][idx].set_shared_memory(
+                            region_name, buf.nbytes
+                        )
+                    else:
+                        infer_inputs[slot][idx].set_data_from_numpy(
+                            buf, **self._binary_data_args
+                        )
+
+            # Batches move through two stages: `staged` holds batches whose
+            # buffer copy has been handed to the marshalling pool, `inflight`
+            # holds batches whose request has been fired.
+            staged = deque()
+            inflight = deque()
+            free_slots = deque(range(n_slots))
+
+            def _promote(block):
+                """
+                Firing the requests of staged batches whose buffer copy has
+                completed, in submission order. When `block` is set the first
+                staged batch is waited on, guaranteeing that at least one
+                request enters flight.
+                """
+                while staged and (block or staged[0][2].done()):
+                    batch_start, slot, marshall_future = staged.popleft()
+                    marshall_future.result()
+                    inflight.append((batch_start, slot, _submit(slot)))
+                    block = False
+
+            # Splitting the outermost dimension into batch-size requests
+            for bi in range(num_batches):
+                # Harvesting the oldest in-flight request frees its slot.
+                if not free_slots:
+                    if not inflight:
+                        _promote(block=True)
+                    batch_start, slot, get_result = inflight.popleft()
+                    _harvest(batch_start, get_result)
+                    free_slots.append(slot)
+                slot = free_slots.popleft()
+
+                staged.append(
+                    (
+                        bi * self.batch_size,
+                        slot,
+                        self.marshall_pool.submit(_stage, bi, slot),
                     )
+                )
+                _promote(block=False)
+
+            # Draining: firing everything still staged, then collecting all
+            # remaining responses.
+            while staged:
+                _promote(block=True)
+            while inflight:
+                batch_start, _, get_result = inflight.popleft()
+                _harvest(batch_start, get_result)
+
+            if (
+                output is None
+            ):  # Input was a length-0, so we should generate the length-0 outputs with correct dimension
+                return {
+                    o: numpy.zeros(shape=(0, *self.model_outputs[o]["shape"][1:]))
+                    for o in output_list
+                }
 
-        if (
-            output is None
-        ):  # Input was a length-0, so we should generate the length-0 outputs with correct dimension
-            return {
-                o: numpy.zeros(shape=(0, *self.model_outputs[o]["shape"][1:]))
-                for o in output_list
-            }
+            return {k: v[:orig_len] for k, v in output.items()}
 
-        return {k: v[:orig_len] for k, v in output.items()}
+        return _specialized_call
@@ -129,6 +129,233 @@ def test_triton():
     client.close()
 
 
+def prepare_triton_wrapper(**kwargs):
+    """
+    Creating a triton_wrapper with the server-derived model metadata stubbed
+    out, so that the pure-python bookkeeping (input validation, batch size
+    resolution, batch splitting) can be tested without an inference server.
+    The metadata attributes are lazy, so assigning their storage slots
+    directly keeps the wrapper from ever spawning a client. The wrapper is
+    abstract, so a concrete subclass with a pass-through `prepare_awkward` is
+    used, mirroring the subclasses user code defines.
+    """
+    from coffea.ml_tools.triton_wrapper import triton_wrapper
+
+    class triton_wrapper_nullmodel(triton_wrapper):
+        def prepare_awkward(self, output_list, input_dict):
+            return [], {"output_list": output_list, "input_dict": input_dict}
+
+    tw = triton_wrapper_nullmodel(
+        model_url="triton+grpc://localhost:8001/pn_test/1", **kwargs
+    )
+    tw._model_inputs = {
+        "points": {
+            "shape": (-1, 2, 100),
+            "datatype": "FP32",
+            "np_dtype": np.float32,
+            "allow_ragged_batch": False,
+        },
+        "features": {
+            "shape": (-1, 5, 100),
+            "datatype": "FP32",
+            "np_dtype": np.float32,
+            "allow_ragged_batch": False,
+        },
+    }
+    tw._model_outputs = {"output": {"shape": (-1, 10)}}
+    return tw
+
+
+def test_triton_validate_numpy_input():
+    _ = pytest.importorskip("tritonclient")
+
+    tw = prepare_triton_wrapper()
+    good_input = {
+        "points": np.random.random(size=(4, 2, 100)).astype(np.float32),
+        "features": np.random.random(size=(4, 5, 100)).astype(np.float32),
+    }
+
+    # A well-formed request should pass without raising
+    tw.validate_numpy_input(["output"], good_input)
+
+    # Input name not defined by the model
+    with pytest.raises(ValueError, match="not defined in model"):
+        tw.validate_numpy_input(["output"], {**good_input, "bad": good_input["points"]})
+
+    # Wrong number of dimensions
+    with pytest.raises(ValueError, match="wrong dimension"):
+        tw.validate_numpy_input(
+            ["output"], {**good_input, "points": np.random.random(size=(4, 200))}
+        )
+
+    # Mismatch on a fixed (positive) model dimension
+    with pytest.raises(ValueError, match="got array of shape"):
+        tw.validate_numpy_input(
+            ["output"], {**good_input, "points": np.random.random(size=(4, 3, 100))}
+        )
+
+    # Missing model input
+    with pytest.raises(ValueError, match="not given in input dictionary"):
+        tw.validate_numpy_input(["output"], {"points": good_input["points"]})
+
+    # Output name not defined by the model
+    with pytest.raises(ValueError, match="not defined by model"):
+        tw.validate_numpy_input(["bad_output"], good_input)
+
+    # Data type mismatches only warn, as conversion is handled automatically
+    with pytest.warns(UserWarning, match="Automatic conversion"):
+        tw.validate_numpy_input(
+            ["output"],
+            {**good_input, "points": np.random.random(size=(4, 2, 100))},
+        )
+
+
+def test_triton_batch_size():
+    _ = pytest.importorskip("tritonclient")
+
+    # The largest preferred batch size of the dynamic batcher should win
+    tw = prepare_triton_wrapper()
+    tw._model_config = {
+        "max_batch_size": 32,
+        "dynamic_batching": {"preferred_batch_size": [4, 8, 16]},
+    }
+    assert tw.batch_size == 16
+
+    # ... but clamped to the model's max_batch_size
+    tw._batch_size = -1
+    tw._model_config = {
+        "max_batch_size": 32,
+        "dynamic_batching": {"preferred_batch_size": [4, 64]},
+    }
+    assert tw.batch_size == 32
+
+    # Without preferred sizes, fall through to max_batch_size
+    tw._batch_size = -1
+    tw._model_config = {"max_batch_size": 24}
+    assert tw.batch_size == 24
+
+    # Nothing declared by the model: warn and use the fallback
+    tw._batch_size = -1
+    tw._model_config = {}
+    with pytest.warns(UserWarning, match="Batch size not set by model"):
+        assert tw.batch_size == tw.batch_size_fallback
+
+    # An explicit user setting always takes precedence
+    tw._batch_size = 7
+    assert tw.batch_size == 7
+
+
+def test_triton_shared_memory_staging():
+    _ = pytest.importorskip("tritonclient")
+    from tritonclient.utils import shared_memory as triton_shm
+
+    tw = prepare_triton_wrapper(use_shared_memory=True, batch_size=2)
+    tw.max_inflight_requests = 2  # Keeping the region count small for testing
+
+    # Region registration only talks to the server; writing through the
+    # buffers does not, so a no-op client suffices here.
+    class nullclient:
+        def register_system_shared_memory(self, name, key, byte_size):
+            pass
+
+        def unregister_system_shared_memory(self, name):
+            pass
+
+    tw._client = nullclient()
+
+    input_dict = {
+        "points": np.random.random(size=(4, 2, 100)).astype(np.float32),
+        "features": np.random.random(size=(4, 5, 100)).astype(np.float32),
+    }
+    tw._build_specialized_call(["output"], input_dict)
+
+    ((_, staging),) = tw._staging_cache.items()
+    assert len(staging) == tw.max_inflight_requests
+    for slot, bufs in enumerate(staging):
+        for name, buf in bufs.items():
+            assert buf.shape == (2, *input_dict[name].shape[1:])
+            # The staging buffer must be a view of the registered region, so
+            # writes through it must be visible in the region itself.
+            _, handle, _ = tw._shm_regions[(slot, name)]
+            buf[:] = slot + 1
+            region_view = triton_shm.get_contents_as_numpy(handle, buf.dtype, buf.shape)
+            assert np.all(region_view == slot + 1)
+            del region_view
+
+    # Dropping all buffer views of the regions so they can be released
+    del buf, bufs, staging
+    tw._staging_cache.clear()
+    tw._release_shared_memory()
+
+
+def test_triton_mismatched_inputs():
+    _ = pytest.importorskip("tritonclient")
+
+    tw = prepare_triton_wrapper()
+    with pytest.raises(ValueError, match="same leading dimension"):
+        tw.numpy_call(
+            ["output"],
+            {
+                "points": np.random.random(size=(4, 2, 100)),
+                "features": np.random.random(size=(3, 5, 100)),
+            },
+        )
+
+
+def test_triton_ragged_batching():
+    _ = pytest.importorskip("tritonclient")
+
+    from coffea.ml_tools.triton_wrapper import _client_pool
+
+    # A ragged-batch model: per-event rows of flattened variable-length data
+    tw = prepare_triton_wrapper()
+    tw._model_inputs = {
+        "points": {
+            "shape": (-1, -1),
+            "datatype": "FP32",
+            "np_dtype": np.float32,
+            "allow_ragged_batch": True,
+        },
+    }
+
+    # Mocked client capturing the per-request tensor shapes and answering each
+    # request with its submission index, so that both the request layout and
+    # the response-to-event pairing can be pinned down.
+    class fakeresult:
+        def __init__(self, value):
+            self.value = value
+
+        def as_numpy(self, name):
+            return np.full((1, 10), self.value, dtype=np.float32)
+
+    class fakeclient:
+        def __init__(self):
+            self.requests = []
+
+        def async_infer(self, model, model_version, inputs, outputs, callback):
+            self.requests.append([tuple(inp.shape()) for inp in inputs])
+            callback(fakeresult(len(self.requests) - 1), None)
+
+    fake = fakeclient()
+    tw._client_pool = _client_pool([fake])
+
+    nevents = 5
+    res = tw.numpy_call(
+        ["output"], {"points": np.random.random(size=(nevents, 7)).astype(np.float32)}
+    )
+
+    # One single-event request per event, keeping the leading batch dimension
+    assert fake.requests == [[(1, 7)]] * nevents
+    # Responses stitched back per event, with the batch dimension stripped
+    assert res["output"].shape == (nevents, 10)
+    assert np.all(res["output"] == np.arange(nevents)[:, np.newaxis])
+
+    # Length-0 inputs short-circuit to empty outputs without any requests
+    res = tw.numpy_call(["output"], {"points": np.zeros((0, 7), dtype=np.float32)})
+    assert res["output"].shape == (0, 10)
+    assert len(fake.requests) == nevents
+
+
 @pytest.mark.dask_client
 def test_torch():
     _ = pytest.importorskip("torch")